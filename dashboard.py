@@ -5,6 +5,7 @@ import os
 import shutil
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
 from src.ConfigManager import ConfigManager
@@ -12,6 +13,9 @@ from src.StateManager import StateManager
 from src.PlaylistResolver import PlaylistResolver
 from src.DownloadEngine import DownloadEngine
 from src.WhisperLyricsEngine import WhisperLyricsEngine
+from src.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 # --- Streamlit Page Config ---
 st.set_page_config(
@@ -78,6 +82,52 @@ st.markdown(
 
 
 # --- Helper Functions ---
+PLAYLISTS_CACHE_FILE = "playlists_cache.json"
+PLAYLISTS_CACHE_TTL = 3600  # 1 hour
+
+
+def _playlists_cache_key(config):
+    """Identify the playlist source so stale caches aren't reused."""
+    if config.input_method == "channel":
+        source = config.channel_url
+    elif config.input_method == "playlist_file":
+        source = config.playlist_file
+    else:
+        source = ",".join(config.playlist_urls)
+    return f"{config.input_method}:{source}"
+
+
+def load_playlists_cache(cache_key):
+    """Load resolved playlists from disk if fresh, else None."""
+    try:
+        with open(PLAYLISTS_CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("key") != cache_key:
+            return None
+        if time.time() - cache.get("saved_at", 0) > PLAYLISTS_CACHE_TTL:
+            return None
+        return cache.get("playlists") or None
+    except Exception:
+        return None
+
+
+def save_playlists_cache(cache_key, playlists):
+    """Persist resolved playlists so fresh sessions skip yt-dlp."""
+    try:
+        with open(PLAYLISTS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(
+                {"key": cache_key, "saved_at": time.time(), "playlists": playlists}, f
+            )
+    except Exception:
+        pass
+
+
+def clear_playlists_cache():
+    try:
+        os.unlink(PLAYLISTS_CACHE_FILE)
+    except OSError:
+        pass
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def get_ytdlp_version(path):
     try:
@@ -103,15 +153,46 @@ def get_disk_usage(path):
         return None
 
 
-def count_download_archives(root_path):
-    """Count total archive files and entries."""
+def _count_archive_entries(path):
+    """Count entries in a single archive file.
+
+    One read syscall plus a C-level splitlines instead of a buffered
+    line loop; yt-dlp writes one entry per line, so the number of
+    non-blank lines equals the entry count.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data:
+        return 0
+    return sum(bool(line.strip()) for line in data.splitlines())
+
+
+def _walk_archives(root_path):
+    """Yield paths of all download_archive.txt files under root_path.
+
+    Uses os.walk directly instead of Path.rglob, which wraps every
+    directory entry in a Path object and is much slower on large trees.
+    """
+    for dirpath, _, filenames in os.walk(root_path):
+        if "download_archive.txt" in filenames:
+            yield os.path.join(dirpath, "download_archive.txt")
+
+
+@st.cache_data(ttl=60)  # Cache for 1 minute
+def count_download_archives(root_path, stamp):
+    """Count total archive files and entries.
+
+    stamp is the root directory's mtime so writes to the root
+    invalidate the cache before the TTL expires.
+    """
     try:
-        archive_files = list(Path(root_path).rglob("download_archive.txt"))
-        total_entries = 0
-        for archive in archive_files:
-            with open(archive, "r", encoding="utf-8") as f:
-                total_entries += len([line for line in f if line.strip()])
-        return len(archive_files), total_entries
+        paths = list(_walk_archives(root_path))
+        if not paths:
+            return 0, 0
+        # Reads are I/O-bound across many small files; overlap them.
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            total_entries = sum(executor.map(_count_archive_entries, paths))
+        return len(paths), total_entries
     except Exception:
         return 0, 0
 
@@ -119,10 +200,21 @@ def count_download_archives(root_path):
 def clear_download_archives(root_path):
     """Remove all download_archive.txt files."""
     try:
-        archive_files = list(Path(root_path).rglob("download_archive.txt"))
-        for archive in archive_files:
-            archive.unlink()
-        return len(archive_files)
+        cleared = 0
+        if hasattr(os, "fwalk"):
+            # fd-relative unlink skips re-resolving the full path for
+            # every file - cheaper on deep trees and network mounts
+            for dirpath, dirnames, filenames, dirfd in os.fwalk(root_path):
+                if "download_archive.txt" in filenames:
+                    os.unlink("download_archive.txt", dir_fd=dirfd)
+                    cleared += 1
+        else:
+            # os.fwalk is unavailable on Windows
+            for archive in _walk_archives(root_path):
+                os.unlink(archive)
+                cleared += 1
+        count_download_archives.clear()
+        return cleared
     except Exception as e:
         st.error(f"Failed to clear archives: {e}")
         return 0
@@ -136,14 +228,44 @@ def init_engines():
         state = StateManager()
         resolver = PlaylistResolver(config, state)
         engine = DownloadEngine(config)
-        lyrics = WhisperLyricsEngine()
-        return config, state, resolver, engine, lyrics
+        return config, state, resolver, engine
     except Exception as e:
         st.error(f"Initialization Error: {e}")
-        return None, None, None, None, None
+        return None, None, None, None
+
+
+@st.cache_resource
+def get_lyrics_engine():
+    """Load the Whisper model lazily - only sync paths need it.
+
+    The model weighs hundreds of MB; viewing the dashboard should not
+    pay that startup and memory cost.
+    """
+    return WhisperLyricsEngine()
+
+
+def _scan_audio_missing_lrc(playlist_dir):
+    """Collect audio files without a matching .lrc in one scandir sweep.
+
+    One directory read instead of two Path.glob passes, and the .lrc
+    existence check is a set-membership test against the names seen in
+    the same pass - no extra stat() per audio file.
+    """
+    try:
+        with os.scandir(playlist_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return []
 
+    return [
+        playlist_dir / name
+        for name in sorted(names)
+        if name.endswith((".opus", ".mp3"))
+        and name.rsplit(".", 1)[0] + ".lrc" not in names
+    ]
 
-def run_sync(p, config, state, engine, lyrics_engine):
+
+def run_sync(p, config, state, engine):
     """Encapsulated sync logic for robustness."""
     with st.status(f"Syncing: {p['title']}", expanded=True) as status:
         status.write("📡 Fetching updates from YouTube...")
@@ -157,26 +279,74 @@ def run_sync(p, config, state, engine, lyrics_engine):
         playlist_dir = config.root_path / engine.clean_filename(p["title"])
         status.write("🎤 Checking for missing lyrics...")
 
-        audio_files = list(playlist_dir.glob("*.opus")) + list(
-            playlist_dir.glob("*.mp3")
-        )
-        for audio_file in audio_files:
-            lrc_file = audio_file.with_suffix(".lrc")
-            if not lrc_file.exists():
-                status.write(f"Transcribing: {audio_file.name}")
-                try:
-                    lyrics_engine.generate_lrc(audio_file)
-                except Exception as e:
-                    status.write(f"⚠️ Failed lyrics for {audio_file.name}: {e}")
+        lyrics_engine = get_lyrics_engine()
+        for audio_file in _scan_audio_missing_lrc(playlist_dir):
+            status.write(f"Transcribing: {audio_file.name}")
+            try:
+                lyrics_engine.generate_lrc(audio_file)
+            except Exception as e:
+                status.write(f"⚠️ Failed lyrics for {audio_file.name}: {e}")
 
         state.mark_completed(p["id"])
         status.update(label=f"✅ Completed: {p['title']}", state="complete")
         return True
 
 
+def run_sync_quiet(p, config, state, engine, lyrics_engine):
+    """Sync a single playlist without touching Streamlit widgets.
+
+    Safe to call from worker threads; the batch sync paths render
+    progress from the main thread instead.
+    """
+    success = engine.download(p)
+    if not success:
+        return False
+
+    playlist_dir = config.root_path / engine.clean_filename(p["title"])
+    for audio_file in _scan_audio_missing_lrc(playlist_dir):
+        try:
+            lyrics_engine.generate_lrc(audio_file)
+        except Exception as e:
+            logger.warning(f"Failed to generate lyrics for {audio_file.name}: {e}")
+
+    state.mark_completed(p["id"])
+    return True
+
+
+def sync_pending_parallel(pending, config, state, engine, on_done=None):
+    """Sync playlists concurrently; downloads are network-bound so a
+    small thread pool scales wall time nearly linearly.
+
+    Returns the playlists that failed to sync so callers can surface
+    them instead of claiming blanket success."""
+    # Fetch the (cached) lyrics engine on the main thread so workers
+    # never touch Streamlit's cache machinery
+    lyrics_engine = get_lyrics_engine()
+    failed = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(
+                run_sync_quiet, p, config, state, engine, lyrics_engine
+            ): p
+            for p in pending
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            p = futures[future]
+            try:
+                success = future.result()
+            except Exception as e:
+                logger.error(f"Sync failed for {p['title']}: {e}")
+                success = False
+            if not success:
+                failed.append(p)
+            if on_done:
+                on_done(i, p)
+    return failed
+
+
 # --- Main App ---
 def main():
-    config, state, resolver, engine, lyrics = init_engines()
+    config, state, resolver, engine = init_engines()
     if not config:
         return
 
@@ -185,6 +355,9 @@ def main():
         st.session_state.playlists = None
     if "last_refresh" not in st.session_state:
         st.session_state.last_refresh = None
+    # One dict for the per-playlist info toggles instead of an
+    # unbounded show_info_<id> key per playlist
+    show_info = st.session_state.setdefault("show_info", {})
 
     # --- Sidebar ---
     with st.sidebar:
@@ -210,7 +383,13 @@ def main():
             st.progress(disk["percent"] / 100)
 
         # Archive stats
-        archive_count, entry_count = count_download_archives(config.root_path)
+        try:
+            root_stamp = os.stat(config.root_path).st_mtime
+        except OSError:
+            root_stamp = 0.0
+        archive_count, entry_count = count_download_archives(
+            str(config.root_path), root_stamp
+        )
         st.metric(
             "Archive Files", f"{archive_count} files", delta=f"{entry_count} entries"
         )
@@ -226,6 +405,7 @@ def main():
         ):
             st.session_state.playlists = None
             st.session_state.last_refresh = datetime.now()
+            clear_playlists_cache()
             st.rerun()
 
         # Sync all
@@ -275,17 +455,31 @@ def main():
         with st.spinner("🔍 Resolving playlists..."):
             start_time = time.time()
 
-            if config.input_method == "channel":
-                playlists = resolver.from_channel()
-            elif config.input_method == "playlist_file":
-                playlists = resolver.from_file()
-            else:
-                playlists = [
-                    resolver.get_playlist_info(url) for url in config.playlist_urls
-                ]
+            # Try the disk cache first - skips the yt-dlp cold start on
+            # fresh sessions and hard refreshes
+            cache_key = _playlists_cache_key(config)
+            playlists = load_playlists_cache(cache_key)
+
+            if playlists is None:
+                if config.input_method == "channel":
+                    playlists = resolver.from_channel()
+                elif config.input_method == "playlist_file":
+                    playlists = resolver.from_file()
+                else:
+                    playlists = resolver.get_playlist_info_batch(
+                        config.playlist_urls
+                    )
+
+                playlists = [p for p in playlists if p]
+                if playlists:
+                    save_playlists_cache(cache_key, playlists)
 
-            playlists = [p for p in playlists if p]
             st.session_state.playlists = playlists
+            # Lowercased titles computed once; the search filter reuses
+            # them on every keystroke instead of re-lowering every title
+            st.session_state.playlist_titles_lc = [
+                p["title"].lower() for p in playlists
+            ]
             st.session_state.last_refresh = datetime.now()
 
             load_time = time.time() - start_time
@@ -312,7 +506,10 @@ def main():
         )
 
     # --- Stats Cards ---
-    completed_ids = [p["id"] for p in playlists if state.is_completed(p["id"])]
+    # Resolve completion once per rerun; sorts/filters below reuse the set
+    completed_ids = frozenset(
+        p["id"] for p in playlists if state.is_completed(p["id"])
+    )
     pending = [p for p in playlists if p["id"] not in completed_ids]
 
     col1, col2, col3, col4 = st.columns(4)
@@ -380,23 +577,42 @@ def main():
         # Apply filters and sorting
         filtered = playlists.copy()
         if search:
-            filtered = [p for p in filtered if search.lower() in p["title"].lower()]
+            search_lc = search.lower()
+            titles_lc = st.session_state.get("playlist_titles_lc")
+            if titles_lc is None or len(titles_lc) != len(playlists):
+                titles_lc = [p["title"].lower() for p in playlists]
+                st.session_state.playlist_titles_lc = titles_lc
+            filtered = [p for p, lc in zip(playlists, titles_lc) if search_lc in lc]
 
         if "Z-A" in sort_option:
             filtered.sort(key=lambda x: x["title"], reverse=True)
         elif "A-Z" in sort_option:
             filtered.sort(key=lambda x: x["title"])
         elif "Pending First" in sort_option:
-            filtered.sort(key=lambda x: (state.is_completed(x["id"]), x["title"]))
+            filtered.sort(key=lambda x: (x["id"] in completed_ids, x["title"]))
         elif "Completed First" in sort_option:
-            filtered.sort(key=lambda x: (not state.is_completed(x["id"]), x["title"]))
+            filtered.sort(key=lambda x: (x["id"] not in completed_ids, x["title"]))
+
+        # Paginate so each rerun reconciles a bounded number of widgets
+        # instead of one card per playlist
+        PAGE_SIZE = 20
+        total_pages = max(1, (len(filtered) + PAGE_SIZE - 1) // PAGE_SIZE)
+
+        col_caption, col_page = st.columns([3, 1])
+        col_caption.caption(f"Showing {len(filtered)} of {len(playlists)} playlists")
+        if total_pages > 1:
+            page = col_page.number_input(
+                "Page", 1, total_pages, key="page_all", help=f"{total_pages} pages"
+            )
+        else:
+            page = 1
 
-        st.caption(f"Showing {len(filtered)} of {len(playlists)} playlists")
+        page_items = filtered[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
 
         # Playlist cards in grid
         cols = st.columns(2)
-        for i, p in enumerate(filtered):
-            is_done = state.is_completed(p["id"])
+        for i, p in enumerate(page_items):
+            is_done = p["id"] in completed_ids
             col_idx = i % 2
 
             with cols[col_idx]:
@@ -421,19 +637,17 @@ def main():
                     use_container_width=True,
                     type="secondary" if is_done else "primary",
                 ):
-                    run_sync(p, config, state, engine, lyrics)
+                    run_sync(p, config, state, engine)
                     st.session_state.playlists = None  # Force refresh
                     st.rerun()
 
                 btn_col2.link_button("🔗 YouTube", p["url"], use_container_width=True)
 
                 if btn_col3.button("ℹ️", key=f"info_{p['id']}", help="Show details"):
-                    st.session_state[f"show_info_{p['id']}"] = not st.session_state.get(
-                        f"show_info_{p['id']}", False
-                    )
+                    show_info[p["id"]] = not show_info.get(p["id"], False)
 
                 # Expandable info
-                if st.session_state.get(f"show_info_{p['id']}", False):
+                if show_info.get(p["id"], False):
                     with st.expander("Details", expanded=True):
                         st.json(p)
 
@@ -445,10 +659,20 @@ def main():
         else:
             if st.button("🚀 Sync All Pending Playlists", type="primary"):
                 progress_bar = st.progress(0)
-                for idx, p in enumerate(pending):
-                    run_sync(p, config, state, engine, lyrics)
-                    progress_bar.progress((idx + 1) / len(pending))
-                st.success("✅ All playlists synced!")
+                failed = sync_pending_parallel(
+                    pending,
+                    config,
+                    state,
+                    engine,
+                    on_done=lambda i, p: progress_bar.progress(i / len(pending)),
+                )
+                if failed:
+                    st.error(
+                        f"❌ {len(failed)} playlist(s) failed to sync: "
+                        + ", ".join(p["title"] for p in failed)
+                    )
+                else:
+                    st.success("✅ All playlists synced!")
                 st.session_state.playlists = None
                 time.sleep(1)
                 st.rerun()
@@ -458,21 +682,21 @@ def main():
                     col1, col2 = st.columns([4, 1])
                     col1.write(f"**{p['title']}**")
                     if col2.button("Sync", key=f"btn_pending_{p['id']}"):
-                        run_sync(p, config, state, engine, lyrics)
+                        run_sync(p, config, state, engine)
                         st.session_state.playlists = None
                         st.rerun()
 
     with tab_completed:
         st.subheader(f"✅ Completed ({len(completed_ids)} playlists)")
 
-        completed_playlists = [p for p in playlists if state.is_completed(p["id"])]
+        completed_playlists = [p for p in playlists if p["id"] in completed_ids]
 
         for p in completed_playlists:
             with st.container():
                 col1, col2, col3 = st.columns([3, 1, 1])
                 col1.write(f"**{p['title']}**")
                 if col2.button("Re-sync", key=f"btn_completed_{p['id']}"):
-                    run_sync(p, config, state, engine, lyrics)
+                    run_sync(p, config, state, engine)
                     st.rerun()
                 col3.link_button("View", p["url"], key=f"link_completed_{p['id']}")
 
@@ -515,12 +739,21 @@ def main():
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            for idx, p in enumerate(pending):
-                status_text.text(f"Syncing {idx + 1}/{len(pending)}: {p['title']}")
-                run_sync(p, config, state, engine, lyrics)
-                progress_bar.progress((idx + 1) / len(pending))
+            def _on_done(i, p):
+                status_text.text(f"Synced {i}/{len(pending)}: {p['title']}")
+                progress_bar.progress(i / len(pending))
 
-            st.success("🎉 All playlists synced successfully!")
+            failed = sync_pending_parallel(
+                pending, config, state, engine, on_done=_on_done
+            )
+
+            if failed:
+                st.error(
+                    f"❌ {len(failed)} playlist(s) failed to sync: "
+                    + ", ".join(p["title"] for p in failed)
+                )
+            else:
+                st.success("🎉 All playlists synced successfully!")
             st.session_state.playlists = None
             time.sleep(2)
             st.rerun()
@@ -1,5 +1,6 @@
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from src.ConfigManager import ConfigManager
@@ -122,10 +123,9 @@ class YouTubeApp:
         elif self.config.input_method == "playlist_file":
             playlists = self.resolver.from_file()
         else:
-            playlists = [
-                self.resolver.get_playlist_info(url)
-                for url in self.config.playlist_urls
-            ]
+            playlists = self.resolver.get_playlist_info_batch(
+                self.config.playlist_urls
+            )
 
         playlists = [p for p in playlists if p]
         if not playlists:
@@ -139,57 +139,111 @@ class YouTubeApp:
         # 2. Processing Loop
         # Note: We no longer filter by 'self.state.is_completed' here.
         # This allows yt-dlp to check the playlist for new songs every 12 hours.
-        success_count = 0
-        fail_count = 0
+        jobs = min(self.config.parallel_jobs, len(playlists))
+
+        if self.config.batch_download and len(playlists) > 1:
+            logger.info("Syncing all playlists in one yt-dlp batch")
+            results = self.sync_batch(playlists)
+        elif jobs > 1:
+            # Each sync is dominated by network wait inside yt-dlp, so a
+            # small thread pool scales wall time nearly linearly. Every
+            # playlist has its own directory and download archive, and
+            # StateManager serializes its own writes.
+            logger.info(f"Syncing with {jobs} parallel jobs")
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(self.sync_playlist, playlists))
+        else:
+            results = [
+                self.sync_playlist(p, index=i, total=len(playlists))
+                for i, p in enumerate(playlists, 1)
+            ]
 
-        for i, p in enumerate(playlists, 1):
-            playlist_id = p["id"]
-            playlist_title = p["title"]
+        success_count = sum(results)
+        fail_count = len(results) - success_count
 
-            logger.info(
-                f"[{i}/{len(playlists)}] Checking for updates: {playlist_title}"
-            )
+        logger.info(
+            f"Sync Cycle Finished! Successful: {success_count}, Failed: {fail_count}"
+        )
 
-            try:
-                # DownloadEngine handles skipping existing files via download_archive.txt
-                success = self.engine.download(p)
+    def sync_playlist(self, p, index=None, total=None) -> bool:
+        """Download one playlist and run its post-processing steps."""
+        playlist_title = p["title"]
 
-                if success:
-                    playlist_dir = self.config.root_path / self.engine.clean_filename(
-                        playlist_title
-                    )
+        prefix = f"[{index}/{total}] " if index else ""
+        logger.info(f"{prefix}Checking for updates: {playlist_title}")
 
-                    # Process lyrics generation and embedding
-                    self.process_playlist_lyrics_and_embedding(playlist_dir)
+        try:
+            # DownloadEngine handles skipping existing files via download_archive.txt
+            success = self.engine.download(p)
 
-                    # Run album naming for this specific playlist
-                    logger.info(f"Running album naming for: {playlist_title}")
-                    try:
-                        namer = NameAlbumFromFolders(playlist_dir)
-                        namer.run()
-                        logger.info(f"✓ Album naming completed for: {playlist_title}")
-                    except ImportError:
-                        logger.warning("name_album_from_folders module not found")
-                    except Exception as e:
-                        logger.warning(f"Album naming failed for {playlist_title}: {e}")
+            if not success:
+                logger.warning(f"✗ Download failed for: {playlist_title}")
+                return False
+
+            return self.finalize_playlist(p)
 
-                    # Mark playlist as completed after successful download
-                    self.state.mark_completed(playlist_id)
-                    logger.info(f"✓ Marked playlist as completed: {playlist_title}")
-                    success_count += 1
-                else:
-                    logger.warning(f"✗ Download failed for: {playlist_title}")
-                    fail_count += 1
+        except Exception as e:
+            logger.error(
+                f"Exception during sync of {playlist_title}: {e}", exc_info=True
+            )
+            return False
+
+    def sync_batch(self, playlists) -> list[bool]:
+        """Download every playlist in one yt-dlp pass, then finalize each."""
+        success, touched_dirs = self.engine.download_many(playlists)
+        if not success:
+            logger.warning("Batch download reported errors; finalizing what completed")
+
+        results = []
+        for p in playlists:
+            playlist_dir = touched_dirs.get(str(p["id"]))
+            if not success and playlist_dir is None:
+                # The batch failed and this playlist received no files;
+                # never mark it completed off the back of a dead process
+                logger.warning(f"✗ Download failed for: {p['title']}")
+                results.append(False)
+                continue
+            results.append(self.finalize_playlist(p, playlist_dir))
+        return results
+
+    def finalize_playlist(self, p, playlist_dir=None) -> bool:
+        """Run post-download steps (lyrics, album naming, state) for one playlist.
+
+        playlist_dir overrides the default clean_filename-derived path;
+        the batch path passes the directory yt-dlp actually wrote to.
+        """
+        playlist_id = p["id"]
+        playlist_title = p["title"]
+        if playlist_dir is None:
+            playlist_dir = self.config.root_path / self.engine.clean_filename(
+                playlist_title
+            )
 
+        try:
+            # Process lyrics generation and embedding
+            self.process_playlist_lyrics_and_embedding(playlist_dir)
+
+            # Run album naming for this specific playlist
+            logger.info(f"Running album naming for: {playlist_title}")
+            try:
+                namer = NameAlbumFromFolders(playlist_dir)
+                namer.run()
+                logger.info(f"✓ Album naming completed for: {playlist_title}")
+            except ImportError:
+                logger.warning("name_album_from_folders module not found")
             except Exception as e:
-                logger.error(
-                    f"Exception during sync of {playlist_title}: {e}", exc_info=True
-                )
-                fail_count += 1
+                logger.warning(f"Album naming failed for {playlist_title}: {e}")
 
-        logger.info(
-            f"Sync Cycle Finished! Successful: {success_count}, Failed: {fail_count}"
-        )
+            # Mark playlist as completed after successful download
+            self.state.mark_completed(playlist_id)
+            logger.info(f"✓ Marked playlist as completed: {playlist_title}")
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Exception during sync of {playlist_title}: {e}", exc_info=True
+            )
+            return False
 
     def run_forever(self):
         """Runs the sync every 12 hours."""
@@ -1,12 +1,25 @@
 import yaml
+import json
 import os
 import sys
+from functools import cached_property
 from pathlib import Path
 from shutil import which
 from src.logging_utils import get_logger
 
+# Prefer the LibYAML C loader; it parses ~10x faster than the pure
+# Python SafeLoader that yaml.safe_load defaults to.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = get_logger(__name__)
 
+# Parsed configs shared across instances in one process, keyed on path
+# and validated against (mtime_ns, size) so edits are always picked up.
+_CONFIG_CACHE = {}
+
 
 class ConfigManager:
     """Handles loading and validating the application configuration."""
@@ -19,15 +32,62 @@ class ConfigManager:
 
     def _load(self):
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                logger.info(f"Loading config from: {self.path}")
-                return yaml.safe_load(f)
+            stat = os.stat(self.path)
         except FileNotFoundError:
             logger.error(f"Config file '{self.path}' not found!")
             sys.exit(1)
-        except yaml.YAMLError as e:
-            logger.error(f"Failed to parse config file: {e}")
-            sys.exit(1)
+
+        # YAML parsing is slow; reuse earlier results while the source
+        # file is unchanged. mtime alone can survive a copy, so the
+        # validity key is the (mtime_ns, size) pair.
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(self.path)
+        if cached and cached[0] == key:
+            logger.debug(f"Using in-process config cache for: {self.path}")
+            return cached[1]
+
+        sidecar = self.path + ".cache.json"
+        data = self._read_sidecar(sidecar, key)
+        if data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    logger.info(f"Loading config from: {self.path}")
+                    data = yaml.load(f, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                logger.error(f"Failed to parse config file: {e}")
+                sys.exit(1)
+            self._write_sidecar(sidecar, key, data)
+
+        _CONFIG_CACHE[self.path] = (key, data)
+        return data
+
+    @staticmethod
+    def _read_sidecar(sidecar, key):
+        """Return cached config data if the sidecar matches key, else None."""
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == list(key):
+                logger.debug(f"Using config cache: {sidecar}")
+                return cached.get("data")
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _write_sidecar(sidecar, key, data):
+        """Write the parse result next to the config; best effort only."""
+        tmp = sidecar + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": list(key), "data": data}, f)
+            os.replace(tmp, sidecar)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write config cache {sidecar}: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
     def _setup_properties(self):
         # Core config
@@ -55,18 +115,11 @@ class ConfigManager:
                 f"Loaded {len(self.playlist_urls)} playlists from file: {self.playlist_file}"
             )
 
-        # Root path resolution
-        root = self.data.get("root_path", "./downloads")
-        if self.os_type == "linux" and root.startswith("~"):
-            root = os.path.expanduser(root)
-
-        self.root_path = Path(root)
-        self.root_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Root download path: {self.root_path}")
-
-        # Executables
-        self.ytdlp_path = self._resolve_exe(self.data.get("ytdlp_path", "yt-dlp"))
-        self.ffmpeg_path = self._resolve_exe(self.data.get("ffmpeg_path", ""))
+        # Raw path values; resolution happens lazily in the cached
+        # properties below so construction does no stat/mkdir syscalls
+        self._root_raw = self.data.get("root_path", "./downloads")
+        self._ytdlp_raw = self.data.get("ytdlp_path", "yt-dlp")
+        self._ffmpeg_raw = self.data.get("ffmpeg_path", "")
 
         # Audio format normalization
         audio_format_raw = self.data.get("audio_format", "best")
@@ -78,6 +131,58 @@ class ConfigManager:
         self.audio_quality = str(self.data.get("audio_quality", "0"))
         self.extra_args = self.data.get("extra_args", "")
 
+        # Lyrics/captions flags — always present so callers can read
+        # them directly instead of defensive getattr lookups
+        self.download_lyrics = bool(self.data.get("download_lyrics", False))
+        self.lyrics_only = bool(self.data.get("lyrics_only", False))
+
+        # Sync every playlist through a single yt-dlp process instead of
+        # one process per playlist (amortizes startup/handshake cost)
+        self.batch_download = bool(self.data.get("batch_download", False))
+
+        # Number of playlists to sync concurrently (1 = serial).
+        # Downloads are network-bound, so a few workers scale well.
+        # concurrent_playlists is accepted as an alias for parallel_jobs.
+        jobs = self.data.get("parallel_jobs")
+        if jobs in (None, ""):
+            jobs = self.data.get("concurrent_playlists", 1)
+        self.parallel_jobs = max(1, int(jobs or 1))
+
+        # Whether to re-encode downloaded opus files to mp3 locally.
+        # Irrelevant when audio_format is "mp3": yt-dlp then transcodes
+        # once during extraction and the extra lossy pass is skipped.
+        self.force_mp3 = bool(self.data.get("force_mp3", True))
+
+        # Fragments yt-dlp downloads in parallel per video (HLS/DASH)
+        self.concurrent_fragments = max(
+            1, int(self.data.get("concurrent_fragments", 8) or 8)
+        )
+
+        # Number of concurrent ffmpeg conversions (defaults to all cores)
+        self.conversion_jobs = max(
+            1, int(self.data.get("conversion_jobs", 0) or os.cpu_count() or 1)
+        )
+
+    @cached_property
+    def root_path(self) -> Path:
+        """Root download directory, created on first access."""
+        root = self._root_raw
+        if self.os_type == "linux" and root.startswith("~"):
+            root = os.path.expanduser(root)
+
+        path = Path(root)
+        path.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Root download path: {path}")
+        return path
+
+    @cached_property
+    def ytdlp_path(self) -> str:
+        return self._resolve_exe(self._ytdlp_raw)
+
+    @cached_property
+    def ffmpeg_path(self) -> str:
+        return self._resolve_exe(self._ffmpeg_raw)
+
     def _load_playlist_file(self, path: str) -> list[str]:
         """
         Load playlist URLs from a text file.
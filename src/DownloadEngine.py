@@ -1,27 +1,212 @@
 from src.ConfigManager import ConfigManager
 from src.logging_utils import get_logger
 import subprocess
+import io
 import re
 import os
+import queue
+import shutil
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from utils.vtt_to_lrc import vtt_to_lrc
 
 logger = get_logger(__name__)
 
+# Cover image type dispatch: exact mime type (parameters stripped) first,
+# URL suffix as fallback, jpg as the final default.
+_CT_TO_EXT = {
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+_URL_TO_EXT = {".jpg": "jpg", ".jpeg": "jpg", ".png": "png", ".webp": "webp"}
+
+# Characters stripped from filenames, per target OS
+_WIN_BAD = re.compile(r'[<>:"/\\|?*]')
+_LINUX_BAD = re.compile(r"[/\0]")
+
+# One alternation classifies a yt-dlp output line in a single scan; the
+# named group of each hit says which category it belongs to. A line can
+# land in several categories (e.g. "[download] ... error:"), which is
+# why the loop collects every match rather than routing on the first.
+_LINE_CLASS_RE = re.compile(
+    r"(?P<activity>\[download\]|\[extractaudio\]"
+    r"|already been recorded in the archive)"
+    r"|(?P<error>error:)"
+    r"|(?P<skippable>video unavailable|private video)"
+    r"|(?P<status>warning|postprocess|ffmpeg)"
+)
+
+
+class _PostProcessPipeline:
+    """
+    Overlaps opus→mp3 and VTT→LRC conversion with a still-running
+    yt-dlp download.
+
+    yt-dlp processes playlist items strictly one after another, so a
+    track's files are final once output lines for the *next* track
+    appear. The pipeline watches Destination lines, and whenever the
+    current track changes it hands the previous track's artifacts to
+    background worker threads. Throughput is then bounded by the
+    slowest stage instead of the sum of all stages.
+    """
+
+    _DEST_RE = re.compile(r"^\[\w+\] Destination: (?P<path>.+)$")
+
+    def __init__(self, engine, dest_dir: Path):
+        self.engine = engine
+        self.dest_dir = dest_dir
+        self._current_stem = None
+        self._queued = set()
+        self._opus_queue = queue.Queue()
+        self._vtt_queue = queue.Queue()
+        self._workers = [
+            threading.Thread(
+                target=self._drain, args=(self._opus_queue, self._convert_opus)
+            ),
+            threading.Thread(
+                target=self._drain, args=(self._vtt_queue, self._convert_vtt)
+            ),
+        ]
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    @staticmethod
+    def _drain(work_queue, handler):
+        while True:
+            item = work_queue.get()
+            if item is None:
+                break
+            try:
+                handler(item)
+            except Exception as e:
+                logger.error("Pipeline worker failed for %s: %s", item, e)
+
+    def _convert_opus(self, opus_file: Path):
+        self.engine._convert_one(opus_file)
+
+    def _convert_vtt(self, vtt_file: Path):
+        lrc_file = vtt_file.with_suffix(".lrc")
+        vtt_to_lrc(vtt_file, lrc_file)
+        logger.info("Converted VTT to LRC: %s → %s", vtt_file.name, lrc_file.name)
+
+    def feed(self, line: str):
+        """Inspect one yt-dlp output line; dispatch finished tracks."""
+        match = self._DEST_RE.match(line)
+        if not match:
+            return
+
+        stem = str(Path(match.group("path")).with_suffix(""))
+        if self._current_stem is not None and stem != self._current_stem:
+            self._flush_stem(self._current_stem)
+        self._current_stem = stem
+
+    def _flush_stem(self, stem: str):
+        """Queue the finished track's opus/vtt files for conversion."""
+        opus_file = Path(stem + ".opus")
+        if (
+            self.engine._should_convert_opus()
+            and opus_file.exists()
+            and opus_file not in self._queued
+        ):
+            self._queued.add(opus_file)
+            self._opus_queue.put(opus_file)
+
+        prefix = os.path.basename(stem)
+        try:
+            with os.scandir(self.dest_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.name.endswith(".vtt"):
+                        vtt_file = Path(entry.path)
+                        if vtt_file not in self._queued:
+                            self._queued.add(vtt_file)
+                            self._vtt_queue.put(vtt_file)
+        except OSError:
+            pass
+
+    def finish(self):
+        """Flush the last track and wait for the workers to drain."""
+        if self._current_stem is not None:
+            self._flush_stem(self._current_stem)
+        self._opus_queue.put(None)
+        self._vtt_queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
 
 class DownloadEngine:
     """
     Wraps yt-dlp execution and manages audio + optional lyric downloads.
     """
 
+    # Minimum seconds between logged [download] percentage lines; yt-dlp
+    # emits them several times per second and each becomes a log record.
+    _PROGRESS_LOG_INTERVAL = 0.1
+
     def __init__(self, config: ConfigManager):
         self.config = config
 
+        # One session reuses TCP/TLS connections across cover downloads
+        # instead of handshaking from scratch for every thumbnail.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Picked once; clean_filename runs for every playlist title
+        self._filename_re = _WIN_BAD if config.os_type == "windows" else _LINUX_BAD
+
+        # The yt-dlp options that never change between invocations are
+        # assembled once; download()/download_many() only append the
+        # archive, output template and URL(s).
+        self._argv_prefix = [
+            config.ytdlp_path,
+            "--extract-audio",
+            "--audio-format",
+            config.audio_format,
+            "--audio-quality",
+            config.audio_quality,
+            "--embed-thumbnail",
+            "--embed-metadata",
+            "--add-metadata",
+            "--no-overwrites",
+            "--ignore-errors",
+            "--concurrent-fragments",
+            str(config.concurrent_fragments),
+        ]
+        if config.ffmpeg_path:
+            self._argv_prefix.extend(["--ffmpeg-location", config.ffmpeg_path])
+        if config.download_lyrics:
+            self._argv_prefix.extend(
+                [
+                    "--write-subs",
+                    "--write-auto-subs",
+                    "--sub-langs",
+                    "en",
+                    "--sub-format",
+                    "vtt",
+                ]
+            )
+        if config.lyrics_only:
+            self._argv_prefix.append("--skip-download")
+        self._extra_args = config.extra_args.split() if config.extra_args else []
+
+    def _should_convert_opus(self) -> bool:
+        """
+        True when downloaded opus files need a local mp3 re-encode.
+        With audio_format "mp3", yt-dlp already transcodes once during
+        extraction, so the extra lossy→lossy ffmpeg pass is skipped.
+        """
+        return self.config.audio_format != "mp3" and self.config.force_mp3
+
     def clean_filename(self, name: str) -> str:
         """Cleans a string to be a safe filename based on OS type."""
-        regex = r'[<>:"/\\|?*]' if self.config.os_type == "windows" else r"[/\0]"
-        cleaned = re.sub(regex, "", name).strip(". ")
+        cleaned = self._filename_re.sub("", name).strip(". ")
         return cleaned[:200]
 
     def download_cover_image(self, playlist_info: dict, dest_dir: Path) -> bool:
@@ -33,103 +218,355 @@ class DownloadEngine:
 
         if not thumbnails:
             logger.warning(
-                f"No thumbnails found for playlist: {playlist_info.get('title', 'Unknown')}"
+                "No thumbnails found for playlist: %s",
+                playlist_info.get("title", "Unknown"),
             )
             return False
 
-        # Sort thumbnails by resolution (highest first) and get the best quality
-        sorted_thumbnails = sorted(
-            thumbnails,
-            key=lambda t: (t.get("height", 0) * t.get("width", 0)),
-            reverse=True,
-        )
+        def resolution(t):
+            return t.get("height", 0) * t.get("width", 0)
+
+        def candidates():
+            # The largest thumbnail almost always downloads fine, so pick
+            # it with a single max() pass; only sort the rest if we have
+            # to fall back to lower resolutions.
+            best = max(thumbnails, key=resolution)
+            yield best
+            yield from sorted(
+                (t for t in thumbnails if t is not best),
+                key=resolution,
+                reverse=True,
+            )
 
-        for thumbnail in sorted_thumbnails:
+        for thumbnail in candidates():
             url = thumbnail.get("url")
             if not url:
                 continue
 
             try:
-                logger.info(f"Downloading cover image from: {url}")
-                response = requests.get(url, timeout=30, stream=True)
+                logger.info("Downloading cover image from: %s", url)
+                response = self._session.get(url, timeout=30, stream=True)
                 response.raise_for_status()
 
                 # Determine file extension from content-type or URL
                 content_type = response.headers.get("content-type", "")
-                if (
-                    "jpeg" in content_type
-                    or "jpg" in content_type
-                    or url.endswith((".jpg", ".jpeg"))
-                ):
-                    ext = "jpg"
-                elif "png" in content_type or url.endswith(".png"):
-                    ext = "png"
-                elif "webp" in content_type or url.endswith(".webp"):
-                    ext = "webp"
-                else:
-                    ext = "jpg"  # Default to jpg
+                mime = content_type.split(";", 1)[0].strip().lower()
+                ext = _CT_TO_EXT.get(mime)
+                if ext is None:
+                    suffix = os.path.splitext(url.split("?", 1)[0])[1].lower()
+                    ext = _URL_TO_EXT.get(suffix, "jpg")
 
                 cover_path = dest_dir / f"cover.{ext}"
 
-                # Download and save the image
+                # Stream straight from the socket to disk in large blocks;
+                # decode_content handles gzip-encoded responses for us
+                response.raw.decode_content = True
                 with open(cover_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, length=131072)
 
-                logger.info(f"Successfully saved cover image: {cover_path.name}")
+                logger.info("Successfully saved cover image: %s", cover_path.name)
                 return True
 
             except requests.exceptions.RequestException as e:
-                logger.warning(f"Failed to download thumbnail from {url}: {e}")
+                logger.warning("Failed to download thumbnail from %s: %s", url, e)
                 continue
             except Exception as e:
-                logger.error(f"Error saving cover image: {e}")
+                logger.error("Error saving cover image: %s", e)
                 continue
 
         logger.warning("Failed to download any cover image")
         return False
 
-    def convert_opus_to_mp3(self, dest_dir: Path) -> None:
+    def _convert_one(self, opus_file: Path) -> None:
+        """Convert a single .opus file to .mp3 and delete the original."""
+        mp3_file = opus_file.with_suffix(".mp3")
+
+        try:
+            logger.debug("Converting: %s → %s", opus_file.name, mp3_file.name)
+
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-threads",
+                    "0",  # Let ffmpeg use all cores for decode/filtering
+                    "-i",
+                    str(opus_file),
+                    "-codec:a",
+                    "libmp3lame",
+                    "-q:a",
+                    "2",  # Quality: 2 is high quality (~192kbps)
+                    "-threads",
+                    "0",
+                    str(mp3_file),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+
+            # Delete the original opus file
+            opus_file.unlink()
+            logger.info("Converted and deleted: %s", opus_file.name)
+
+        except subprocess.CalledProcessError as e:
+            logger.error("Failed to convert %s to mp3: %s", opus_file.name, e)
+        except Exception as e:
+            logger.error("Error during conversion of %s: %s", opus_file.name, e)
+
+    @staticmethod
+    def _scan_post_files(dest_dir: Path) -> tuple[list, list]:
+        """
+        Collect .opus and .vtt files with a single directory scan,
+        instead of one glob pass per extension.
+        """
+        opus_files, vtt_files = [], []
+        try:
+            with os.scandir(dest_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".opus"):
+                        opus_files.append(Path(entry.path))
+                    elif entry.name.endswith(".vtt"):
+                        vtt_files.append(Path(entry.path))
+        except OSError as e:
+            logger.warning("Could not scan %s: %s", dest_dir, e)
+        return opus_files, vtt_files
+
+    def convert_opus_to_mp3(self, dest_dir: Path, opus_files=None) -> None:
         """
         Convert all .opus files to .mp3 using ffmpeg and delete the original opus files.
+        Conversions are independent per file, so they run in parallel
+        across CPU cores (bounded by the conversion_jobs config value).
+        Pass opus_files to reuse an existing directory scan.
         """
-        opus_files = list(dest_dir.glob("*.opus"))
+        if opus_files is None:
+            opus_files = list(dest_dir.glob("*.opus"))
         if not opus_files:
             logger.debug("No opus files found to convert")
             return
 
-        logger.info(f"Converting {len(opus_files)} opus file(s) to mp3...")
+        logger.info("Converting %d opus file(s) to mp3...", len(opus_files))
 
-        for opus_file in opus_files:
-            mp3_file = opus_file.with_suffix(".mp3")
+        workers = min(len(opus_files), self.config.conversion_jobs)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._convert_one, opus_files))
 
+    def _run_and_monitor(self, cmd, line_hook=None) -> tuple[int, bool, bool, list]:
+        """
+        Run a yt-dlp command, streaming and classifying its output.
+        line_hook, if given, receives every non-empty output line.
+        Returns (returncode, download_started, error_occurred, error_logs).
+        """
+        download_started = False
+        error_occurred = False
+        error_logs = []
+        last_progress_log = 0.0
+
+        # Binary pipe with a 64KB buffer; decoding happens lazily in the
+        # TextIOWrapper on whole buffered chunks instead of per readline.
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=65536,
+            shell=self.config.os_type == "windows",
+        )
+        stdout = io.TextIOWrapper(process.stdout, encoding="utf-8", errors="replace")
+
+        # A dedicated reader drains the pipe into a queue so yt-dlp never
+        # blocks on a full pipe while we spend time logging/classifying.
+        lines = queue.Queue(maxsize=4096)
+
+        def _pump():
             try:
-                logger.debug(f"Converting: {opus_file.name} → {mp3_file.name}")
-
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-i",
-                        str(opus_file),
-                        "-codec:a",
-                        "libmp3lame",
-                        "-q:a",
-                        "2",  # Quality: 2 is high quality (~192kbps)
-                        str(mp3_file),
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=True,
-                )
+                for raw in stdout:
+                    lines.put(raw)
+            finally:
+                lines.put(None)
+
+        reader = threading.Thread(target=_pump, daemon=True)
+        reader.start()
+
+        while True:
+            raw = lines.get()
+            if raw is None:
+                break
+            line = raw.strip()
+            if not line:
+                continue
 
-                # Delete the original opus file
-                opus_file.unlink()
-                logger.info(f"Converted and deleted: {opus_file.name}")
+            if line_hook is not None:
+                try:
+                    line_hook(line)
+                except Exception as e:
+                    logger.debug("line_hook error: %s", e)
 
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to convert {opus_file.name} to mp3: {e}")
-            except Exception as e:
-                logger.error(f"Error during conversion of {opus_file.name}: {e}")
+            lowered = line.lower()
+            categories = {m.lastgroup for m in _LINE_CLASS_RE.finditer(lowered)}
+            if not categories:
+                continue
+
+            # Detect if activity happened (new download, extraction, or skipping archived items)
+            if "activity" in categories:
+                download_started = True
+                # Percentage progress lines are throttled; other activity
+                # (new destinations, archive skips) is always logged
+                if "%" in line and "[download]" in lowered:
+                    now = time.monotonic()
+                    if now - last_progress_log >= self._PROGRESS_LOG_INTERVAL:
+                        last_progress_log = now
+                        logger.info("   %s", line)
+                else:
+                    logger.info("   %s", line)
+
+            # Check for errors
+            if "error" in categories and "ignore" not in lowered:
+                # Handle common non-fatal YouTube errors (unavailable/private videos)
+                if "skippable" in categories:
+                    logger.warning("Skipping unavailable video: %s", line)
+                    continue
+
+                error_occurred = True
+                error_logs.append(line)
+                logger.error("%s", line)
+
+            # Print other relevant warnings or status messages
+            elif "status" in categories:
+                logger.info("   %s", line)
+
+        process.wait()
+        reader.join()
+        return process.returncode, download_started, error_occurred, error_logs
+
+    def download_many(self, playlist_infos: list) -> tuple[bool, dict]:
+        """
+        Download several playlists with a single yt-dlp invocation.
+
+        Spawning yt-dlp per playlist pays its full startup and TLS
+        handshake cost every time; one process amortizes that across the
+        whole batch. Per-playlist download archives stay authoritative:
+        they are merged into a temporary batch archive before the run,
+        and new entries are written back to the right directory using
+        yt-dlp's --print-to-file records.
+
+        Returns (success, {playlist_id: dest_dir}) for playlists that
+        received new files.
+        """
+        if not playlist_infos:
+            return True, {}
+
+        root = self.config.root_path
+        root.mkdir(parents=True, exist_ok=True)
+
+        infos_by_id = {str(p["id"]): p for p in playlist_infos}
+
+        # Merge every per-playlist archive into one batch archive so the
+        # single process still skips everything already downloaded.
+        known_entries = set()
+        for archive in root.glob("*/download_archive.txt"):
+            try:
+                with open(archive, "r", encoding="utf-8") as f:
+                    known_entries.update(line.strip() for line in f if line.strip())
+            except OSError as e:
+                logger.warning("Could not read archive %s: %s", archive, e)
+
+        batch_archive = root / ".batch_download_archive.txt"
+        records_file = root / ".batch_download_records.txt"
+        urls_file = root / ".batch_urls.txt"
+        with open(batch_archive, "w", encoding="utf-8") as f:
+            f.write("\n".join(sorted(known_entries)))
+            if known_entries:
+                f.write("\n")
+        # yt-dlp appends to the records file, so start clean
+        records_file.write_text("", encoding="utf-8")
+
+        # Feed URLs through --batch-file rather than argv; large batches
+        # would otherwise run into platform command-line length limits
+        with open(urls_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(p["url"] for p in playlist_infos))
+            f.write("\n")
+
+        cmd = [
+            *self._argv_prefix,
+            "--download-archive",
+            str(batch_archive),
+            "--print-to-file",
+            "after_move:%(extractor)s %(id)s\t%(playlist_id)s\t%(filepath)s",
+            str(records_file),
+            "--output",
+            str(root / "%(playlist_title)s" / "%(title)s.%(ext)s"),
+            *self._extra_args,
+            "--batch-file",
+            str(urls_file),
+        ]
+
+        logger.info("Batch downloading %d playlists in one pass", len(playlist_infos))
+
+        try:
+            returncode, download_started, error_occurred, error_logs = (
+                self._run_and_monitor(cmd)
+            )
+
+            success = returncode == 0 or (download_started and not error_occurred)
+            if not success:
+                logger.error("Batch download failed (exit code %s)", returncode)
+                for err in error_logs[-5:]:
+                    logger.error("  %s", err)
+
+            # Distribute new archive entries back to per-playlist archives
+            # and collect which directories actually changed.
+            touched_dirs = {}
+            try:
+                with open(records_file, "r", encoding="utf-8") as f:
+                    for record in f:
+                        record = record.strip()
+                        if not record or "\t" not in record:
+                            continue
+                        entry, playlist_id, filepath = record.split("\t", 2)
+                        dest_dir = Path(filepath).parent
+                        touched_dirs[str(playlist_id)] = dest_dir
+                        dir_archive = dest_dir / "download_archive.txt"
+                        with open(dir_archive, "a", encoding="utf-8") as af:
+                            af.write(entry + "\n")
+            except OSError as e:
+                logger.warning("Could not process batch records: %s", e)
+
+            # Covers go into the directories yt-dlp actually wrote to
+            # (taken from the records), which can differ from
+            # clean_filename(title) because yt-dlp sanitizes playlist
+            # titles with its own rules.
+            for playlist_id, dest_dir in touched_dirs.items():
+                info = infos_by_id.get(playlist_id)
+                if info is not None:
+                    self.download_cover_image(info, dest_dir)
+
+            # Post-process every directory that received new files
+            for dest_dir in set(touched_dirs.values()):
+                opus_files, vtt_files = self._scan_post_files(dest_dir)
+
+                if self._should_convert_opus():
+                    self.convert_opus_to_mp3(dest_dir, opus_files=opus_files)
+
+                if self.config.download_lyrics:
+                    for vtt_file in vtt_files:
+                        lrc_file = vtt_file.with_suffix(".lrc")
+                        if lrc_file.exists():
+                            continue
+                        try:
+                            vtt_to_lrc(vtt_file, lrc_file)
+                        except Exception as e:
+                            logger.error("Failed to convert %s: %s", vtt_file.name, e)
+
+            return success, touched_dirs
+
+        except Exception as e:
+            logger.error("Download Engine exception: %s", e, exc_info=True)
+            return False, {}
+        finally:
+            for tmp in (batch_archive, records_file, urls_file):
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
 
     def download(self, playlist_info: dict) -> bool:
         """
@@ -141,161 +578,86 @@ class DownloadEngine:
         dest_dir.mkdir(parents=True, exist_ok=True)
 
         # Download cover image first
-        logger.info(f"Downloading cover image for playlist: {clean_title}")
+        logger.info("Downloading cover image for playlist: %s", clean_title)
         self.download_cover_image(playlist_info, dest_dir)
 
         archive_file = dest_dir / "download_archive.txt"
 
-        # Build the command
+        # Only the per-playlist parts are appended to the shared prefix
         cmd = [
-            self.config.ytdlp_path,
-            "--extract-audio",
-            "--audio-format",
-            self.config.audio_format,
-            "--audio-quality",
-            self.config.audio_quality,
-            "--embed-thumbnail",
-            "--embed-metadata",
-            "--add-metadata",
+            *self._argv_prefix,
             "--download-archive",
             str(archive_file),
-            "--no-overwrites",
-            "--ignore-errors",
+            "--output",
+            str(dest_dir / "%(title)s.%(ext)s"),
+            *self._extra_args,
+            playlist_info["url"],
         ]
 
-        # Add ffmpeg path if specified in config
-        if getattr(self.config, "ffmpeg_path", None):
-            cmd.extend(["--ffmpeg-location", self.config.ffmpeg_path])
-
-        # ---- Lyrics / captions support ----
-        if getattr(self.config, "download_lyrics", False):
-            cmd.extend(
-                [
-                    "--write-subs",
-                    "--write-auto-subs",
-                    "--sub-langs",
-                    "en",
-                    "--sub-format",
-                    "vtt",
-                ]
-            )
-
-        if getattr(self.config, "lyrics_only", False):
-            cmd.append("--skip-download")
-
-        # ---- Output & URL ----
-        cmd.extend(
-            [
-                "--output",
-                str(dest_dir / "%(title)s.%(ext)s"),
-                playlist_info["url"],
-            ]
-        )
-
-        if self.config.extra_args:
-            cmd.extend(self.config.extra_args.split())
-
-        logger.info(f"Target Directory: {dest_dir}")
-        logger.debug(f"Executing yt-dlp command for playlist: {clean_title}")
-
-        download_started = False
-        error_occurred = False
-        error_logs = []
+        logger.info("Target Directory: %s", dest_dir)
+        logger.debug("Executing yt-dlp command for playlist: %s", clean_title)
 
         try:
             # Pre-flight check: Ensure yt-dlp executable exists if a full path was provided
             if "\\" in self.config.ytdlp_path or "/" in self.config.ytdlp_path:
                 if not Path(self.config.ytdlp_path).exists():
                     logger.error(
-                        f"yt-dlp executable not found at: {self.config.ytdlp_path}"
+                        "yt-dlp executable not found at: %s", self.config.ytdlp_path
                     )
                     return False
 
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                shell=self.config.os_type == "windows",
-                encoding="utf-8",
-                errors="replace",
-            )
-
-            for line in process.stdout:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Detect if activity happened (new download, extraction, or skipping archived items)
-                if any(
-                    x in line.lower()
-                    for x in [
-                        "[download]",
-                        "[extractaudio]",
-                        "already been recorded in the archive",
-                    ]
-                ):
-                    logger.info(f"   {line}")
-                    download_started = True
-
-                # Check for errors
-                if "error:" in line.lower() and "ignore" not in line.lower():
-                    # Handle common non-fatal YouTube errors (unavailable/private videos)
-                    if (
-                        "video unavailable" in line.lower()
-                        or "private video" in line.lower()
-                    ):
-                        logger.warning(f"Skipping unavailable video: {line}")
-                        continue
-
-                    error_occurred = True
-                    error_logs.append(line)
-                    logger.error(f"{line}")
-
-                # Print other relevant warnings or status messages
-                elif any(
-                    x in line.lower() for x in ["warning", "postprocess", "ffmpeg"]
-                ):
-                    logger.info(f"   {line}")
-
-            process.wait()
+            # Convert finished tracks while yt-dlp keeps downloading
+            pipeline = _PostProcessPipeline(self, dest_dir)
+            try:
+                returncode, download_started, error_occurred, error_logs = (
+                    self._run_and_monitor(cmd, line_hook=pipeline.feed)
+                )
+            finally:
+                pipeline.finish()
 
             # Logic: Success if return code is 0 OR if we managed to process/skip videos despite minor errors
-            success = process.returncode == 0 or (
-                download_started and not error_occurred
-            )
+            success = returncode == 0 or (download_started and not error_occurred)
 
             if not success:
-                logger.error(f"Download failed for: {playlist_info['title']}")
-                logger.error(f"Exit Code: {process.returncode}")
+                logger.error("Download failed for: %s", playlist_info["title"])
+                logger.error("Exit Code: %s", returncode)
                 if error_logs:
                     logger.error("Captured Error Messages:")
                     for err in error_logs[-5:]:
-                        logger.error(f"  {err}")
+                        logger.error("  %s", err)
                     logger.error("Check the URL or your network connection.")
                     return False
 
-            # ---- Post-process: Convert OPUS to MP3 ----
-            self.convert_opus_to_mp3(dest_dir)
+            # ---- Post-process (anything the pipeline missed) ----
+            # One directory scan covers both the opus and vtt sweeps
+            opus_files, vtt_files = self._scan_post_files(dest_dir)
+
+            if self._should_convert_opus():
+                self.convert_opus_to_mp3(dest_dir, opus_files=opus_files)
 
             # ---- Post-process: VTT → LRC ----
-            if getattr(self.config, "download_lyrics", False):
-                for vtt_file in dest_dir.glob("*.vtt"):
+            if self.config.download_lyrics:
+                for vtt_file in vtt_files:
                     lrc_file = vtt_file.with_suffix(".lrc")
+                    if lrc_file.exists():
+                        # Already converted (usually by the pipeline
+                        # while the download was still running)
+                        continue
                     try:
                         vtt_to_lrc(vtt_file, lrc_file)
                         logger.info(
-                            f"Converted VTT to LRC: {vtt_file.name} → {lrc_file.name}"
+                            "Converted VTT to LRC: %s → %s",
+                            vtt_file.name,
+                            lrc_file.name,
                         )
                     except Exception as e:
-                        logger.error(f"Failed to convert {vtt_file.name}: {e}")
+                        logger.error("Failed to convert %s: %s", vtt_file.name, e)
 
             logger.info(
-                f"Successfully completed download for: {playlist_info['title']}"
+                "Successfully completed download for: %s", playlist_info["title"]
             )
             return True
 
         except Exception as e:
-            logger.error(f"Download Engine exception: {e}", exc_info=True)
+            logger.error("Download Engine exception: %s", e, exc_info=True)
             return False
@@ -6,10 +6,34 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tqdm import tqdm
 
+# orjson parses the large JSON dumps yt-dlp emits several times faster
+# than the stdlib; fall back transparently when it is not installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Matches either a list=<id> parameter anywhere in the line or a bare
+# playlist ID at the start; one search replaces the substring checks and
+# per-line re.search in from_file.
+_FILE_LINE_RE = re.compile(r"list=([A-Za-z0-9_-]+)|^((?:PL|OL)[A-Za-z0-9_-]+)")
+
+# Playlist ID from any URL carrying a list= parameter
+_LIST_ID_RE = re.compile(r"list=([^&]+)")
+
+
+@lru_cache(maxsize=4096)
+def _extract_playlist_id(url: str) -> str:
+    """Playlist ID for a URL; memoized since the same URLs recur."""
+    match = _LIST_ID_RE.search(url)
+    return match.group(1) if match else url.split("/")[-1]
+
 
 class PlaylistResolver:
     """Resolves playlist IDs and metadata from various input sources."""
@@ -19,17 +43,133 @@ class PlaylistResolver:
         self.state = state
 
     def extract_id(self, url):
-        match = re.search(r"list=([^&]+)", url)
-        return match.group(1) if match else url.split("/")[-1]
+        return _extract_playlist_id(url)
 
     def get_playlist_info(self, url):
-        playlist_id = self.extract_id(url)
-        cached = self.state.get_cached_info(playlist_id)
-        if cached:
-            logger.debug(f"Using cached info for playlist {playlist_id}")
-            return cached
+        """Resolve a single playlist URL; thin wrapper over the batch form."""
+        infos = self.get_playlist_info_batch([url])
+        return infos[0] if infos else None
 
-        logger.info(f"Fetching playlist info for: {url}")
+    def get_playlist_info_batch(self, urls):
+        """
+        Resolve metadata for several playlist URLs with one yt-dlp call.
+
+        Cached playlists are answered from state; the rest are fetched by
+        a single --flat-playlist process (first item only per playlist)
+        instead of paying subprocess startup once per URL. Results come
+        back in the same order as the input list.
+        """
+        results = {}
+        pending = []  # every uncached (url, playlist_id), for the fill loop
+        to_fetch = []  # unique by playlist ID; drives the fetch process
+        seen_ids = set()
+        for url in urls:
+            playlist_id = str(self.extract_id(url))
+            cached = self.state.get_cached_info(playlist_id)
+            if cached:
+                logger.debug(f"Using cached info for playlist {playlist_id}")
+                results[url] = cached
+                continue
+            pending.append((url, playlist_id))
+            if playlist_id not in seen_ids:
+                seen_ids.add(playlist_id)
+                to_fetch.append((url, playlist_id))
+
+        fetched = {}
+        if to_fetch:
+            logger.info(f"Fetching info for {len(to_fetch)} playlists in one pass")
+            id_to_url = {pid: url for url, pid in to_fetch}
+            cmd = [
+                self.config.ytdlp_path,
+                "--flat-playlist",
+                "--dump-json",
+                "--playlist-items",
+                "1",
+                "--ignore-errors",
+            ]
+            cmd.extend(url for url, _ in to_fetch)
+
+            try:
+                # Iterate the pipe directly instead of materializing the
+                # whole dump: memory stays at one line, and the first
+                # playlist is parsed while yt-dlp still works on the rest.
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+                # yt-dlp emits one JSON object per line (NDJSON)
+                for line in proc.stdout:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        data = _json_loads(line)
+                    except ValueError:
+                        continue
+                    playlist_id = str(data.get("playlist_id") or "")
+                    if playlist_id not in id_to_url or playlist_id in fetched:
+                        continue
+                    title = (
+                        data.get("playlist_title")
+                        or data.get("playlist")
+                        or f"Playlist_{playlist_id}"
+                    )
+                    info = {
+                        "id": playlist_id,
+                        "title": str(title),
+                        "url": id_to_url[playlist_id],
+                    }
+                    self.state.cache_info(playlist_id, info, defer=True)
+                    fetched[playlist_id] = info
+                proc.wait()
+            except Exception as e:
+                logger.error(f"Batch playlist info fetch failed: {e}")
+
+            if not fetched:
+                # A single bad URL or a crashed process can sink the whole
+                # batch; retry individually on a small thread pool (the
+                # work is subprocess-bound, so threads scale fine) before
+                # settling for placeholders.
+                logger.info(
+                    f"Batch fetch returned nothing; retrying "
+                    f"{len(to_fetch)} URLs individually"
+                )
+                workers = min(8, len(to_fetch))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    infos = executor.map(
+                        lambda item: self._fetch_single_info(*item), to_fetch
+                    )
+                for (url, playlist_id), info in zip(to_fetch, list(infos)):
+                    if info:
+                        self.state.cache_info(playlist_id, info, defer=True)
+                        fetched[playlist_id] = info
+
+        # Fall back to a placeholder for anything yt-dlp could not resolve,
+        # mirroring the single-URL error path. Iterates pending rather
+        # than to_fetch so duplicate URLs still get a result entry.
+        for url, playlist_id in pending:
+            info = fetched.get(playlist_id)
+            if info is None:
+                logger.warning(f"Could not fetch info for {url}; using placeholder")
+                info = {
+                    "id": playlist_id,
+                    "title": f"Playlist_{playlist_id}",
+                    "url": url,
+                }
+                self.state.cache_info(playlist_id, info, defer=True)
+            results[url] = info
+
+        # One state write for the whole batch
+        self.state.flush()
+
+        return [results[url] for url in urls if url in results]
+
+    def _fetch_single_info(self, url, playlist_id):
+        """Fetch one playlist's metadata; used by the threaded fallback."""
         cmd = [
             self.config.ytdlp_path,
             "--flat-playlist",
@@ -38,7 +178,6 @@ class PlaylistResolver:
             "1",
             url,
         ]
-
         try:
             result = subprocess.run(
                 cmd,
@@ -48,37 +187,20 @@ class PlaylistResolver:
                 errors="replace",
                 check=True,
             )
-            for line in result.stdout.strip().split("\n"):
+            for line in result.stdout.splitlines():
+                line = line.strip()
                 if not line:
                     continue
-                data = json.loads(line)
+                data = _json_loads(line)
                 title = (
                     data.get("playlist_title")
                     or data.get("playlist")
                     or f"Playlist_{playlist_id}"
                 )
-                info = {"id": str(playlist_id), "title": str(title), "url": url}
-                self.state.cache_info(playlist_id, info)
-                logger.debug(f"Cached playlist info: {title}")
-                return info
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Failed to fetch info for {url}: {e}")
-            info = {
-                "id": str(playlist_id),
-                "title": f"Playlist_{playlist_id}",
-                "url": url,
-            }
-            self.state.cache_info(playlist_id, info)
-            return info
+                return {"id": playlist_id, "title": str(title), "url": url}
         except Exception as e:
-            logger.error(f"Error processing playlist info for {url}: {e}")
-            info = {
-                "id": str(playlist_id),
-                "title": f"Playlist_{playlist_id}",
-                "url": url,
-            }
-            self.state.cache_info(playlist_id, info)
-            return info
+            logger.warning(f"Failed to fetch info for {url}: {e}")
+        return None
 
     def from_channel(self):
         """Fetch all playlists from a channel using yt-dlp."""
@@ -89,15 +211,19 @@ class PlaylistResolver:
         cmd = [self.config.ytdlp_path, "-J", "--flat-playlist", url]
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                check=True,
+            # Keep the dump as one bytes buffer and parse it directly:
+            # text=True would decode the whole multi-megabyte payload into
+            # a second str copy before the JSON parser even starts.
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
+            stdout, stderr = proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    proc.returncode, cmd, stdout, stderr
+                )
 
-            data = json.loads(result.stdout)
+            data = _json_loads(stdout)
 
             # Store channel metadata
             channel_info = {
@@ -133,10 +259,11 @@ class PlaylistResolver:
                     "ie_key": entry.get("ie_key"),
                 }
 
-                # Cache the info
-                self.state.cache_info(playlist_id, playlist_info)
+                # Cache the info; flushed once after the loop
+                self.state.cache_info(playlist_id, playlist_info, defer=True)
                 playlists.append(playlist_info)
 
+            self.state.flush()
             logger.info(
                 f"Successfully processed {len(playlists)} playlists from channel"
             )
@@ -144,9 +271,13 @@ class PlaylistResolver:
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to fetch playlists from channel: {e}")
-            logger.error(f"stderr: {e.stderr if hasattr(e, 'stderr') else 'N/A'}")
+            stderr = e.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", errors="replace")
+            logger.error(f"stderr: {stderr or 'N/A'}")
             return []
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             logger.error(f"Failed to parse JSON response: {e}")
             return []
         except Exception as e:
@@ -160,28 +291,31 @@ class PlaylistResolver:
             return []
 
         urls = []
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(file_path, "r", encoding="utf-8", buffering=1 << 16) as f:
             for line in f:
                 line = line.strip()
                 if not line or line.startswith("#"):
                     continue
-                if "list=" in line:
-                    if line.startswith("http"):
-                        urls.append(line)
-                    else:
-                        match = re.search(r"list=([^&\s]+)", line)
-                        if match:
-                            urls.append(
-                                f"https://music.youtube.com/playlist?list={match.group(1)}"
-                            )
-                elif line.startswith(("PL", "OL")):
-                    urls.append(f"https://music.youtube.com/playlist?list={line}")
-
-        logger.info(f"Processing {len(urls)} playlist URLs from file")
-        results = []
-        for url in tqdm(urls, desc="Processing file URLs", unit="url"):
-            info = self.get_playlist_info(url)
-            if info:
-                results.append(info)
+                # Cheap substring test first; the regex only runs on
+                # lines that can actually contain a playlist reference
+                if "list=" not in line and not line.startswith(("PL", "OL")):
+                    continue
+                match = _FILE_LINE_RE.search(line)
+                if not match:
+                    continue
+                if match.group(1) and line.startswith("http"):
+                    urls.append(line)
+                else:
+                    playlist_id = match.group(1) or match.group(2)
+                    urls.append(
+                        f"https://music.youtube.com/playlist?list={playlist_id}"
+                    )
+
+        # Dedupe while preserving order; the batch fetch answers cached
+        # playlists straight from state and resolves only the remainder
+        # with a single yt-dlp call.
+        unique_urls = list(dict.fromkeys(urls))
+        logger.info(f"Processing {len(unique_urls)} playlist URLs from file")
+        results = [info for info in self.get_playlist_info_batch(unique_urls) if info]
         logger.info(f"Successfully processed {len(results)} playlists from file")
         return results
@@ -1,7 +1,16 @@
 import json
+import os
+import threading
 from pathlib import Path
 from src.logging_utils import get_logger
 
+# orjson handles the growing state dict several times faster than the
+# stdlib on both ends; fall back transparently when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -10,7 +19,17 @@ class StateManager:
 
     def __init__(self, file_path="download_state.json"):
         self.file_path = Path(file_path)
+        # Mutations may come from download worker threads; serialize
+        # them and the file writes. RLock because mutators call save().
+        self._lock = threading.RLock()
+        # Set by deferred mutations; flush() persists them in one write
+        self._dirty = False
+        # Hash of the last bytes written; lets save() skip no-op writes
+        self._last_state_hash = None
         self.state = self._load()
+        # Membership checks run once per playlist per sync; keep the
+        # completed IDs in a set and serialize a sorted list on save.
+        self._completed_set = set(self.state.get("completed_playlists", []))
 
     def _load(self):
         default_state = {
@@ -23,50 +42,87 @@ class StateManager:
             logger.info(f"State file {self.file_path} not found, using default state")
             return default_state
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                logger.info(f"Loaded state from {self.file_path}")
-                loaded_state = json.loads(content) if content else default_state
-                # Ensure channel_info exists in loaded state
-                if "channel_info" not in loaded_state:
-                    loaded_state["channel_info"] = {}
-                return loaded_state
-        except (json.JSONDecodeError, ValueError):
+            content = self.file_path.read_bytes().strip()
+            logger.info(f"Loaded state from {self.file_path}")
+            if not content:
+                return default_state
+            loaded_state = orjson.loads(content) if orjson else json.loads(content)
+            # Ensure channel_info exists in loaded state
+            if "channel_info" not in loaded_state:
+                loaded_state["channel_info"] = {}
+            return loaded_state
+        except ValueError:
             logger.warning(
                 f"State file {self.file_path} is corrupted, using default state"
             )
             return default_state
 
     def save(self):
+        # Compact separators keep the file small; the tmp + os.replace
+        # dance means a crash mid-write can never corrupt the state file.
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                self.state["completed_playlists"] = sorted(self._completed_set)
+                if orjson is not None:
+                    payload = orjson.dumps(self.state)
+                else:
+                    payload = json.dumps(
+                        self.state, ensure_ascii=False, separators=(",", ":")
+                    ).encode("utf-8")
+                digest = hash(payload)
+                if digest == self._last_state_hash:
+                    self._dirty = False
+                    logger.debug("State unchanged; skipping write")
+                    return
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.file_path)
+                self._last_state_hash = digest
+                self._dirty = False
             logger.debug(f"State saved to {self.file_path}")
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
 
+    def flush(self):
+        """Persist any deferred mutations; no-op when state is clean."""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
     def is_completed(self, playlist_id):
-        return str(playlist_id) in self.state["completed_playlists"]
+        return str(playlist_id) in self._completed_set
 
     def mark_completed(self, playlist_id):
         pid = str(playlist_id)
-        if pid not in self.state["completed_playlists"]:
-            self.state["completed_playlists"].append(pid)
-            self.save()
+        with self._lock:
+            if pid not in self._completed_set:
+                self._completed_set.add(pid)
+                self.save()
 
     def get_cached_info(self, playlist_id):
         return self.state.get("playlist_info", {}).get(str(playlist_id))
 
-    def cache_info(self, playlist_id, info):
-        if "playlist_info" not in self.state:
-            self.state["playlist_info"] = {}
-        self.state["playlist_info"][str(playlist_id)] = info
-        self.save()
+    def cache_info(self, playlist_id, info, defer=False):
+        """
+        Cache playlist metadata. With defer=True the write is postponed
+        until flush(), so bulk loops serialize the state once instead of
+        once per playlist.
+        """
+        with self._lock:
+            if "playlist_info" not in self.state:
+                self.state["playlist_info"] = {}
+            self.state["playlist_info"][str(playlist_id)] = info
+            if defer:
+                self._dirty = True
+            else:
+                self.save()
 
     def cache_channel_info(self, channel_info):
         """Cache channel metadata."""
-        self.state["channel_info"] = channel_info
-        self.save()
+        with self._lock:
+            self.state["channel_info"] = channel_info
+            self.save()
         logger.info(
             f"Cached channel info for: {channel_info.get('channel', 'Unknown')}"
         )
@@ -83,7 +139,7 @@ class StateManager:
         """Get statistics about cached data."""
         return {
             "total_playlists": len(self.state.get("playlist_info", {})),
-            "completed_playlists": len(self.state.get("completed_playlists", [])),
+            "completed_playlists": len(self._completed_set),
             "partial_downloads": len(self.state.get("partially_downloaded", {})),
             "channel_cached": bool(self.state.get("channel_info", {})),
         }
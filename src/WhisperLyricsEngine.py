@@ -1,4 +1,5 @@
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +29,9 @@ class WhisperLyricsEngine:
             device="cpu",
             compute_type=compute_type,
         )
+        # One model instance is shared across sync worker threads;
+        # transcription itself is serialized to keep it safe.
+        self._lock = threading.Lock()
         logger.info("Whisper model initialized successfully")
 
     def _to_wav(self, audio_path: Path) -> Path:
@@ -91,22 +95,23 @@ class WhisperLyricsEngine:
 
         try:
             logger.debug(f"Running Whisper transcription on {wav_path.name}")
-            segments, info = self.model.transcribe(
-                str(wav_path),
-                task="transcribe",
-                language=None,  # auto-detect
-            )
-
-            # 🔑 Only override Urdu
-            if info.language == "ur":
-                logger.debug("Detected Urdu language, overriding with Hindi")
+            with self._lock:
                 segments, info = self.model.transcribe(
                     str(wav_path),
                     task="transcribe",
-                    language="hi",
+                    language=None,  # auto-detect
                 )
 
-            self._write_vtt(segments, vtt_path)
+                # 🔑 Only override Urdu
+                if info.language == "ur":
+                    logger.debug("Detected Urdu language, overriding with Hindi")
+                    segments, info = self.model.transcribe(
+                        str(wav_path),
+                        task="transcribe",
+                        language="hi",
+                    )
+
+                self._write_vtt(segments, vtt_path)
             vtt_to_lrc(vtt_path, lrc_path)
             logger.info(f"Successfully generated LRC file: {lrc_path.name}")
 
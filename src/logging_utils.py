@@ -1,15 +1,21 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+# All loggers feed one queue; a single background listener does the
+# actual formatting and stdout writes. Log calls on hot paths (like the
+# yt-dlp monitor loop) then cost a queue put instead of a blocking
+# terminal write.
+_log_queue = queue.Queue(-1)
+_listener = None
 
-def get_logger(name: str = "app") -> logging.Logger:
-    logger = logging.getLogger(name)
-
-    if logger.handlers:
-        return logger
 
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
+def _ensure_listener() -> None:
+    global _listener
+    if _listener is not None:
+        return
 
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
@@ -19,8 +25,24 @@ def get_logger(name: str = "app") -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    console_handler.flush = sys.stdout.flush
 
-    logger.addHandler(console_handler)
+    _listener = logging.handlers.QueueListener(
+        _log_queue, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str = "app") -> logging.Logger:
+    logger = logging.getLogger(name)
+
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    _ensure_listener()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
     return logger
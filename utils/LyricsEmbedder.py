@@ -1,4 +1,5 @@
 import os
+from itertools import chain
 from pathlib import Path
 from mutagen.flac import FLAC
 from mutagen.mp4 import MP4
@@ -144,24 +145,15 @@ class LyricsEmbedder:
         # Supported audio extensions
         audio_extensions = [".mp3", ".flac", ".m4a", ".mp4", ".opus"]
 
-        # Collect all audio files
-        audio_files = []
-        if recursive:
-            for ext in audio_extensions:
-                audio_files.extend(directory.rglob(f"*{ext}"))
-        else:
-            for ext in audio_extensions:
-                audio_files.extend(directory.glob(f"*{ext}"))
+        # Stream the glob iterators instead of materializing one big
+        # list; each file is visited exactly once anyway
+        glob = directory.rglob if recursive else directory.glob
+        audio_files = chain.from_iterable(glob(f"*{ext}") for ext in audio_extensions)
 
-        stats["total"] = len(audio_files)
-
-        if not audio_files:
-            logger.info(f"No audio files found in: {directory}")
-            return stats
-
-        logger.info(f"Processing {stats['total']} audio files in: {directory}")
+        logger.info(f"Processing audio files in: {directory}")
 
         for audio_path in audio_files:
+            stats["total"] += 1
             lrc_path = audio_path.with_suffix(".lrc")
 
             if not lrc_path.exists():
@@ -177,6 +169,10 @@ class LyricsEmbedder:
             else:
                 stats["failed"] += 1
 
+        if stats["total"] == 0:
+            logger.info(f"No audio files found in: {directory}")
+            return stats
+
         logger.info(
             f"Lyrics embedding complete - "
             f"Total: {stats['total']}, "
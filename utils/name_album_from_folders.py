@@ -1,5 +1,6 @@
 import os
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from mutagen.id3 import (
     ID3,
@@ -37,49 +38,31 @@ def normalize(text: str) -> str:
 
 def clean_title(filename: str) -> str:
     """Strip numbering and weird characters from title."""
-    title = Path(filename).stem
-    while title and (title[0].isdigit() or title[0] in ".- "):
-        title = title[1:]
+    title = Path(filename).stem.lstrip("0123456789.- ")
     title = title.replace("_", " ").strip()
     return normalize(title)
 
 
-def read_existing_artist_and_cover(filepath: str):
-    """Extract original TPE1 + APIC frames."""
-    artist = "Unknown Artist"
-    covers = []
-
-    try:
-        audio = ID3(filepath)
-
-        if "TPE1" in audio:
-            artist = normalize(audio["TPE1"].text[0])
-
-        for key in audio.keys():
-            if key.startswith("APIC"):
-                covers.append(audio[key])
+def rewrite_tags(filepath: str, album: str, title: str, track_num: int):
+    """Rewrite ID3 tags in a single load/save cycle.
 
-    except:
-        pass
-
-    return artist, covers
-
-
-def wipe_tags(filepath: str):
-    """Remove all existing ID3 tags (v1 + v2)."""
+    Loads the existing tag once, preserves the track artist (TPE1) and
+    cover art (APIC), clears everything else, and saves the normalized
+    frames back in one write instead of separate read/wipe/write passes.
+    """
     try:
         audio = ID3(filepath)
-        audio.delete()
-        audio.save()
     except ID3NoHeaderError:
-        pass
+        audio = ID3()
 
+    artist = "Unknown Artist"
+    if "TPE1" in audio:
+        artist = normalize(audio["TPE1"].text[0])
 
-def write_clean_tags(
-    filepath: str, album: str, title: str, track_num: int, artist: str, covers
-):
-    """Write clean ID3 tags."""
-    audio = ID3()
+    # getall resolves APIC frames directly instead of scanning every key
+    covers = audio.getall("APIC")
+
+    audio.clear()
 
     audio.add(TALB(encoding=3, text=album))  # Album
     audio.add(TPE2(encoding=3, text=ALBUM_ARTIST_DEFAULT))  # Album Artist (grouping)
@@ -106,7 +89,25 @@ def write_clean_tags(
             )
         )
 
-    audio.save(filepath)
+    # v1=0 strips any pre-existing ID3v1 tag, matching what the old
+    # separate delete() pass did; the v2 tag stays at mutagen's default
+    # version (2.4).
+    audio.save(filepath, v1=0)
+
+
+def process_album(root: str, mp3s: list[str]):
+    """Retag all MP3s of one album folder (module-level for pool workers)."""
+    album_name = normalize(os.path.basename(root))
+    logger.info(f"Processing Album Folder: {album_name}")
+
+    # Alphabetically ordered MP3 list = track order
+    for index, mp3_file in enumerate(mp3s, start=1):
+        full_path = os.path.join(root, mp3_file)
+        logger.info(f"Track {index}: {mp3_file}")
+
+        # Rewrite normalized tags with new track # (alphabetical)
+        # in a single load/save pass
+        rewrite_tags(full_path, album_name, clean_title(mp3_file), index)
 
 
 # ------------------------
@@ -130,29 +131,23 @@ class NameAlbumFromFolders:
             logger.error(f"Invalid folder path: {self.root_path}")
             return
 
+        albums = []
         for root, dirs, files in os.walk(self.root_path):
             mp3s = sorted([f for f in files if f.lower().endswith(".mp3")])
+            if mp3s:
+                albums.append((root, mp3s))
 
-            if not mp3s:
-                continue
-
-            album_name = normalize(os.path.basename(root))
-            logger.info(f"Processing Album Folder: {album_name}")
-
-            # Alphabetically ordered MP3 list = track order
-            for index, mp3_file in enumerate(mp3s, start=1):
-                full_path = os.path.join(root, mp3_file)
-                logger.info(f"Track {index}: {mp3_file}")
-
-                # Extract track metadata to preserve
-                artist, covers = read_existing_artist_and_cover(full_path)
-                title = clean_title(mp3_file)
-
-                # Remove all existing tags
-                wipe_tags(full_path)
+        if not albums:
+            logger.info("No album folders with MP3 files found.")
+            return
 
-                # Write normalized tags with new track # (alphabetical)
-                write_clean_tags(full_path, album_name, title, index, artist, covers)
+        # Albums are independent of each other, so retag them in parallel.
+        # Threads rather than processes: the work is dominated by file
+        # I/O, and forked workers would inherit the QueueHandler without
+        # the listener thread, silently dropping their log lines.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            roots, mp3_lists = zip(*albums)
+            list(executor.map(process_album, roots, mp3_lists))
 
         logger.info("All albums processed successfully with alphabetic track ordering.")
 